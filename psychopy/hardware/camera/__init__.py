@@ -582,6 +582,11 @@ class CameraInterfaceFFmpeg(CameraInterface):
         self._recordBarrier = None  # created in `open()`
         self._playerThread = None
 
+        # frame size cached off the first converted frame so we don't make an
+        # FFI call per frame; refreshed if the source reports a new size
+        self._streamFrameSize = None
+        self._lastSrcSize = None
+
     def _assertMediaPlayer(self):
         return self._playerThread is not None
     
@@ -652,7 +657,8 @@ class CameraInterfaceFFmpeg(CameraInterface):
         """
         if self._playerThread is not None:
             raise RuntimeError('Cannot open `MediaPlayer`, already opened.')
-        
+
+        self._frameIndex = 0  # restart frame numbering for the new stream
         self._exitEvent.clear()  # signal the thread to stop
         
         def _frameGetterAsync(videoCapture, frameQueue, exitEvent, recordEvent, 
@@ -685,15 +691,20 @@ class CameraInterfaceFFmpeg(CameraInterface):
                 will be captured.
 
             """           
-            # warmup the stream, wait for metadata
+            # Warmup the stream, wait for metadata. Poll with an adaptive
+            # backoff: start with very short sleeps so the first frame is
+            # picked up with minimal latency, doubling towards 1 ms so we
+            # don't spin hot if the device is slow to start.
             ptsStart = 0.0  # may be used in the future
+            sleepTime = 0.000125
             while True:
                 frame, val = videoCapture.get_frame()
                 if frame is not None:
                     ptsStart = videoCapture.get_pts()
                     break
-                
-                time.sleep(0.001)
+
+                time.sleep(sleepTime)
+                sleepTime = min(sleepTime * 2.0, 0.001)
 
             # if we have a valid frame, determine the polling rate
             metadata = videoCapture.get_metadata()
@@ -708,14 +719,24 @@ class CameraInterfaceFFmpeg(CameraInterface):
 
             warmUpBarrier.wait()  # wait for main thread to be ready
 
+            # Bind frequently used methods to locals; this loop runs 'hot' at
+            # up to ~2x the frame rate and re-resolving these attributes on
+            # every pass is measurable interpreter overhead.
+            getFrame = videoCapture.get_frame
+            getPts = videoCapture.get_pts
+            putFrame = frameQueue.put
+            exitRequested = exitEvent.is_set
+            recordRequested = recordEvent.is_set
+            sleep = time.sleep
+
             # start capturing frames in background thread
             isRecording = False
             lastAbsTime = -1.0  # presentation timestamp of the last frame
-            while not exitEvent.is_set():  # quit if signaled
+            while not exitRequested():  # quit if signaled
                 # pull a frame from the stream, we keep this running 'hot' so
                 # that we don't miss frames, we just discard them if we don't
                 # need them
-                frame, val = videoCapture.get_frame(force_refresh=False)
+                frame, val = getFrame(force_refresh=False)
 
                 if val == 'eof':  # thread should exit if stream is done
                     break
@@ -726,31 +747,31 @@ class CameraInterfaceFFmpeg(CameraInterface):
                 else:
                     # don't queue frames unless they are newer than the last
                     if isRecording:
-                        thisFrameAbsTime = videoCapture.get_pts()
+                        thisFrameAbsTime = getPts()
                         if lastAbsTime < thisFrameAbsTime:
-                            frameQueue.put((frame, val, metadata))
+                            putFrame((frame, val, metadata))
                             lastAbsTime = thisFrameAbsTime
 
-                if recordEvent.is_set() and not isRecording:
+                if recordRequested() and not isRecording:
                     if audioCapture is not None:
                         audioCapture.start(waitForStart=1)
                     recordingBarrier.wait()
                     isRecording = True
-                elif not recordEvent.is_set() and isRecording:
+                elif not recordRequested() and isRecording:
                     if audioCapture is not None:
                         audioCapture.stop(blockUntilStopped=1)
                     recordingBarrier.wait()
                     isRecording = False
 
                 if not isRecording:
-                    time.sleep(pollInterval)
+                    sleep(pollInterval)
                     continue
 
                 if audioCapture is not None:
                     if audioCapture.isRecording:
                         audioCapture.poll()
 
-                time.sleep(pollInterval)
+                sleep(pollInterval)
             
             videoCapture.close_player()
 
@@ -865,6 +886,26 @@ class CameraInterfaceFFmpeg(CameraInterface):
         except queue.Empty:
             return False
 
+        return self._convertFrame(frameData)
+
+    def _convertFrame(self, frameData):
+        """Convert raw frame data pulled off the queue into a `MovieFrame`.
+
+        The resulting frame is stored as `_lastFrame`.
+
+        Parameters
+        ----------
+        frameData : tuple
+            Frame data formatted as `(frame, val, metadata)` as put on the
+            queue by the stream thread.
+
+        Returns
+        -------
+        bool
+            `True` if a valid frame was converted, `False` if the data
+            indicated end of stream, a paused stream or no frame.
+
+        """
         frame, val, metadata = frameData  # update the frame
 
         if val == CAMERA_STATUS_EOF:  # handle end of stream
@@ -876,22 +917,46 @@ class CameraInterfaceFFmpeg(CameraInterface):
         
         frameImage, pts = frame  # otherwise, unpack the frame
 
-        # if we have a new frame, update the frame information
-        videoBuffer = frameImage.to_bytearray()[0]
+        # If we have a new frame, update the frame information. This is a
+        # zero-copy path: `to_memoryview` exposes the decoder's pixel plane
+        # directly and `frombuffer` wraps it without copying the full frame
+        # into an intermediate bytearray. The `keepAlive` reference on the
+        # MovieFrame pins the Image so the array view stays valid for as long
+        # as the frame is retained (e.g. while buffered for recording).
+        # Stride safety: with the default `keep_align=False`, ffpyplayer hands
+        # back tightly packed rows, copying internally only when the plane
+        # carries alignment padding, so the flat view never includes padding
+        # bytes.
+        videoBuffer = frameImage.to_memoryview()[0].memview
         videoFrameArray = np.frombuffer(videoBuffer, dtype=np.uint8)
 
+        # the frame size is constant until the source changes resolution, so
+        # only take the FFI round-trip when that happens
+        srcSize = metadata['src_vid_size'] if metadata is not None else None
+        frameSize = self._streamFrameSize
+        if frameSize is None or srcSize != self._lastSrcSize:
+            frameSize = self._streamFrameSize = frameImage.get_size()
+            self._lastSrcSize = srcSize
+
         # provide the last frame
         self._lastFrame = MovieFrame(
             frameIndex=self._frameIndex,
             absTime=pts,
             # displayTime=self._recentMetadata['frame_size'],
-            size=frameImage.get_size(),
+            size=frameSize,
             colorData=videoFrameArray,
             audioChannels=0,
             audioSamples=None,
             metadata=metadata,
             movieLib=self._cameraLib,
-            userData=None)
+            userData=None,
+            keepAlive=frameImage)
+
+        # A queued frame is always newer than the last one (the capture thread
+        # gates on pts before queuing), so every conversion advances the
+        # index. Frames discarded unconverted by the stale-frame drain in
+        # `getRecentFrame` are not numbered.
+        self._frameIndex += 1
 
         return True
 
@@ -973,8 +1038,20 @@ class CameraInterfaceFFmpeg(CameraInterface):
             The most recent frame from the stream.
 
         """
-        while self._enqueueFrame():
-            pass
+        self._assertMediaPlayer()
+
+        # Drain everything waiting in the queue but only run the conversion
+        # on the newest item; frames behind it are already stale and get
+        # discarded without the ndarray unpack.
+        frameData = None
+        while True:
+            try:
+                frameData = self._frameQueue.get_nowait()
+            except queue.Empty:
+                break
+
+        if frameData is not None:
+            self._convertFrame(frameData)
 
         return self._lastFrame
 
@@ -1130,7 +1207,9 @@ class CameraInterfaceOpenCV(CameraInterface):
         """Open the camera stream and start reading frames using OpenCV2.
         """
         import cv2
-        
+
+        self._frameIndex = 0  # restart frame numbering for the new stream
+
         def _frameGetterAsync(videoCapture, frameQueue, exitEvent, recordEvent, 
                               warmUpBarrier, recordingBarrier, audioCapture):
             """Get frames asynchronously from the camera stream.
@@ -1171,11 +1250,19 @@ class CameraInterfaceOpenCV(CameraInterface):
             # take frames
             warmUpBarrier.wait()
 
+            # Bind frequently used methods to locals, this loop runs at the
+            # camera frame rate and attribute lookups per pass add up
+            readFrame = videoCapture.read
+            putFrame = frameQueue.put
+            exitRequested = exitEvent.is_set
+            recordRequested = recordEvent.is_set
+            convertColor = cv2.cvtColor
+
             # start capturing frames
             isRecording = False
-            while not exitEvent.is_set():
+            while not exitRequested():
                 # Capture frame-by-frame
-                ret, frame = videoCapture.read()
+                ret, frame = readFrame()
 
                 # if frame is read correctly ret is True
                 if not ret:  # eol or something else
@@ -1185,17 +1272,17 @@ class CameraInterfaceOpenCV(CameraInterface):
                     # don't queue frames unless they are newer than the last
                     if isRecording:
                         # color conversion is done in the thread here
-                        colorData = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        colorData = convertColor(frame, cv2.COLOR_BGR2RGB)
                         # colorData = frame
-                        frameQueue.put((colorData, 0.0, None))
+                        putFrame((colorData, 0.0, None))
 
                 # check if we should start or stop recording
-                if recordEvent.is_set() and not isRecording:
+                if recordRequested() and not isRecording:
                     if audioCapture is not None:
                         audioCapture.start(waitForStart=1)
                     recordingBarrier.wait()
                     isRecording = True
-                elif not recordEvent.is_set() and isRecording:
+                elif not recordRequested() and isRecording:
                     if audioCapture is not None:
                         audioCapture.stop(blockUntilStopped=1)
                     recordingBarrier.wait()
@@ -1307,6 +1394,26 @@ class CameraInterfaceOpenCV(CameraInterface):
         except queue.Empty:
             return False
 
+        return self._convertFrame(frameData)
+
+    def _convertFrame(self, frameData):
+        """Convert raw frame data pulled off the queue into a `MovieFrame`.
+
+        The resulting frame is stored as `_lastFrame`.
+
+        Parameters
+        ----------
+        frameData : tuple
+            Frame data formatted as `(frame, val, metadata)` as put on the
+            queue by the stream thread.
+
+        Returns
+        -------
+        bool
+            `True` if a valid frame was converted, `False` if the data
+            indicated end of stream, a paused stream or no frame.
+
+        """
         frame, val, _ = frameData  # update the frame
 
         if val == 'eof':  # handle end of stream
@@ -1318,10 +1425,14 @@ class CameraInterfaceOpenCV(CameraInterface):
         
         frameImage = frame  # otherwise, unpack the frame
 
-        # if we have a new frame, update the frame information
-        # videoBuffer = frameImage.to_bytearray()[0]
+        # If we have a new frame, update the frame information. The capture
+        # thread hands us a freshly allocated, contiguous array per frame (the
+        # output of its color conversion), so that array doubles as the
+        # frame's own pixel storage and we only take a flat view over it here.
+        # A shared buffer pool is not an option in this path since frames may
+        # be retained by the recording buffer and must each own their data.
         videoFrameArray = np.ascontiguousarray(
-            frameImage.flatten(), dtype=np.uint8)
+            frameImage, dtype=np.uint8).reshape(-1)
 
         # provide the last frame
         self._lastFrame = MovieFrame(
@@ -1337,6 +1448,10 @@ class CameraInterfaceOpenCV(CameraInterface):
             movieLib=self._cameraLib,
             userData=None)
 
+        # every converted frame is a genuinely new capture, advance the index;
+        # frames discarded unconverted by `getRecentFrame` are not numbered
+        self._frameIndex += 1
+
         return True
 
     def close(self):
@@ -1412,8 +1527,20 @@ class CameraInterfaceOpenCV(CameraInterface):
             The most recent frame from the stream.
 
         """
-        while self._enqueueFrame():
-            pass
+        self._assertMediaPlayer()
+
+        # Drain everything waiting in the queue but only run the conversion
+        # on the newest item; frames behind it are already stale and get
+        # discarded without the ndarray unpack.
+        frameData = None
+        while True:
+            try:
+                frameData = self._frameQueue.get_nowait()
+            except queue.Empty:
+                break
+
+        if frameData is not None:
+            self._convertFrame(frameData)
 
         return self._lastFrame
 
@@ -3,7 +3,6 @@ from psychopy.alerts import alert
 from psychopy import logging
 from psychopy.iohub.devices import importDeviceModule
 from psychopy.tools.attributetools import AttributeGetSetMixin
-from copy import copy
 import importlib
 import sys
 
@@ -15,6 +14,22 @@ class EyetrackerControl(AttributeGetSetMixin):
         self.actionType = actionType
         self.status = NOT_STARTED
 
+    @property
+    def status(self):
+        """
+        Status of this Component, from psychopy.constants (NOT_STARTED,
+        STARTED, etc.)
+        """
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        # Builder scripts may write the same status every frame; treat a
+        # write of the current value as a no-op
+        if value == getattr(self, "_status", None):
+            return
+        self._status = value
+
     def start(self):
         """
         Start recording
@@ -53,6 +68,28 @@ class EyetrackerControl(AttributeGetSetMixin):
         return self.pos
 
 
+def _alertEyelink(calib):
+    if calib.movementAnimation:
+        # Alert user that their animation params aren't used
+        # alert(code=4520, strFields={"brand": "EyeLink"})
+        pass
+
+
+def _alertGazePoint(calib):
+    if not calib.progressMode == "time":
+        # As GazePoint doesn't use auto-pace, alert user
+        alert(4530, strFields={"brand": "GazePoint"})
+
+
+# backend-specific alerts delivered before calibration, keyed on the ioHub
+# device class string so `run` dispatches with a single dict lookup rather
+# than comparing the full class path against each backend in turn
+_calibrationAlerts = {
+    'eyetracker.hw.sr_research.eyelink.EyeTracker': _alertEyelink,
+    'eyetracker.hw.gazepoint.gp3.EyeTracker': _alertGazePoint,
+}
+
+
 class EyetrackerCalibration:
     def __init__(self, win,
                  eyetracker, target,
@@ -78,41 +115,63 @@ class EyetrackerCalibration:
         self.expandScale = expandScale
         # Attribute to store data from last run
         self.last = None
+        # Cached output of __iter__ alongside a fingerprint of the settings it
+        # was built from, so repeated dict(self) calls don't rebuild it
+        self._dictCache = None
+        self._dictKey = None
+        # ioHub device class string, cached on first access as it's fixed for
+        # the lifetime of the tracker
+        self._trackerClass = None
+
+    def _getTrackerClass(self):
+        """Get the ioHub device class string for the tracker, querying the
+        eyetracker only on first access.
+        """
+        if self._trackerClass is None:
+            self._trackerClass = self.eyetracker.getIOHubDeviceClass(full=True)
+
+        return self._trackerClass
 
     def __iter__(self):
         """Overload dict() method to return in ioHub format"""
-        tracker = self.eyetracker.getIOHubDeviceClass(full=True)
-        # split into package and class name
-        pkgName = ".".join(tracker.split(".")[:-1])
-        clsName = tracker.split(".")[-1]
-        # make sure pkgName is fully qualified
-        if not pkgName.startswith("psychopy.iohub.devices."):
-            pkgName = "psychopy.iohub.devices." + pkgName
-        # import package
-        pkg = importDeviceModule(pkgName)
-        # get tracker class
-        trackerCls = getattr(pkg, clsName)
-        # get self as dict
-        asDict = trackerCls.getCalibrationDict(self)
+        tracker = self._getTrackerClass()
+        # fingerprint the settings which feed into the calibration dict; if
+        # none have changed since the last call, the cached dict is still valid
+        key = (
+            tracker,
+            id(self.target), self.target.colorSpace, self.target.units,
+            self.colorSpace, self.units,
+            self.progressMode, self.targetLayout, self.randomisePos,
+            self.movementAnimation, self.targetDelay, self.targetDur,
+            self.expandScale, self.textColor,
+            repr(self.win._color),
+        )
+        if key != self._dictKey:
+            # split into package and class name
+            pkgName = ".".join(tracker.split(".")[:-1])
+            clsName = tracker.split(".")[-1]
+            # make sure pkgName is fully qualified
+            if not pkgName.startswith("psychopy.iohub.devices."):
+                pkgName = "psychopy.iohub.devices." + pkgName
+            # import package
+            pkg = importDeviceModule(pkgName)
+            # get tracker class
+            trackerCls = getattr(pkg, clsName)
+            # get self as dict and cache for next time
+            self._dictCache = trackerCls.getCalibrationDict(self)
+            self._dictKey = key
 
         # return
-        for key, value in asDict.items():
+        for key, value in self._dictCache.items():
             yield key, value
 
     def run(self):
-        tracker = self.eyetracker.getIOHubDeviceClass(full=True)
+        tracker = self._getTrackerClass()
 
         # Deliver any alerts as needed
-        if tracker == 'eyetracker.hw.sr_research.eyelink.EyeTracker':
-            if self.movementAnimation:
-                # Alert user that their animation params aren't used
-                # alert(code=4520, strFields={"brand": "EyeLink"})
-                pass
-
-        elif tracker == 'eyetracker.hw.gazepoint.gp3.EyeTracker':
-            if not self.progressMode == "time":
-                # As GazePoint doesn't use auto-pace, alert user
-                alert(4530, strFields={"brand": "GazePoint"})
+        alertFunc = _calibrationAlerts.get(tracker)
+        if alertFunc is not None:
+            alertFunc(self)
 
         # Minimise PsychoPy window
         if self.win._isFullScr and sys.platform == 'win32':
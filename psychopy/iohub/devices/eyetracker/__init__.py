@@ -268,24 +268,29 @@ class EyeTrackerDevice(Device):
         dict
             Dict describing the given Calibration object
         """
+        # fallback colour for targets with no fill/border set, computed once
+        # rather than via a dynamic getattr in each dict entry
+        winColor = getattr(calib.target.win._color, calib.colorSpace)
+        # target animation settings, built once up front
+        animate = {
+            'enable': calib.movementAnimation,
+            'expansion_ratio': calib.expandScale,
+            'contract_only': calib.expandScale == 1,
+        }
         return {
             'target_attributes': {
                 # target outer circle
                 'outer_diameter': calib.target.radius * 2,
                 'outer_stroke_width': calib.target.outer.lineWidth,
-                'outer_fill_color': getattr(calib.target.outer._fillColor, calib.colorSpace) if calib.target.outer._fillColor else getattr(calib.target.win._color, calib.colorSpace),
-                'outer_line_color': getattr(calib.target.outer._borderColor, calib.colorSpace) if calib.target.outer._borderColor else getattr(calib.target.win._color, calib.colorSpace),
+                'outer_fill_color': getattr(calib.target.outer._fillColor, calib.colorSpace) if calib.target.outer._fillColor else winColor,
+                'outer_line_color': getattr(calib.target.outer._borderColor, calib.colorSpace) if calib.target.outer._borderColor else winColor,
                 # target inner circle
                 'inner_diameter': calib.target.innerRadius * 2,
                 'inner_stroke_width': calib.target.inner.lineWidth,
-                'inner_fill_color': getattr(calib.target.inner._borderColor, calib.colorSpace) if calib.target.inner._borderColor else getattr(calib.target.win._color, calib.colorSpace),
-                'inner_line_color': getattr(calib.target.inner._borderColor, calib.colorSpace) if calib.target.inner._borderColor else getattr(calib.target.win._color, calib.colorSpace),
+                'inner_fill_color': getattr(calib.target.inner._borderColor, calib.colorSpace) if calib.target.inner._borderColor else winColor,
+                'inner_line_color': getattr(calib.target.inner._borderColor, calib.colorSpace) if calib.target.inner._borderColor else winColor,
                 # target animation
-                'animate':{
-                    'enable': calib.movementAnimation,
-                    'expansion_ratio': calib.expandScale,
-                    'contract_only': calib.expandScale == 1,
-                },
+                'animate': animate,
             },
             'type': calib.targetLayout,
             'randomize': calib.randomisePos,
@@ -864,7 +864,10 @@ class MovieFileWriter:
                     '`MediaWriter.write_frame().')
         elif self._encoderLib == 'opencv':  # OpenCV `VideoWriter`
             if isinstance(image, np.ndarray):
-                image = image.reshape(self._size[0], self._size[1], 3)
+                # rows-first (height, width, channels) as OpenCV expects; this
+                # is a stride-only view when the input is already contiguous
+                frameWidth, frameHeight = self._size
+                image = image.reshape(frameHeight, frameWidth, 3)
                 return np.ascontiguousarray(image, dtype=np.uint8)
             else:
                 raise TypeError(
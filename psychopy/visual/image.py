@@ -274,12 +274,14 @@ class ImageStim(BaseVisualStim, DraggingMixin, ContainerMixin, ColorMixin,
             GL.GL_PIXEL_UNPACK_BUFFER,
             GL.GL_WRITE_ONLY)
 
-        bufferArray = numpy.ctypeslib.as_array(
-            ctypes.cast(bufferPtr, ctypes.POINTER(GL.GLubyte)),
-            shape=(nBufferBytes,))
-
-        # copy data
-        bufferArray[:] = colorData[:]
+        # Copy the frame directly into the mapped buffer. `memmove` from the
+        # frame's buffer pointer is a single C memcpy into the driver's
+        # memory; wrapping the mapped pointer in an ndarray first just adds
+        # per-frame overhead around the same copy.
+        ctypes.memmove(
+            bufferPtr,
+            colorData.ctypes.data,
+            min(nBufferBytes, colorData.nbytes))
 
         # Very important that we unmap the buffer data after copying, but
         # keep the buffer bound for setting the texture.
@@ -18,7 +18,6 @@ from ffpyplayer.player import MediaPlayer  # very first thing to import
 import time
 import psychopy.logging as logging
 import math
-import numpy as np
 import threading
 import queue
 from psychopy.core import getTime
@@ -40,9 +39,23 @@ DEFAULT_FF_OPTS = {
     'loop': 0           # enable looping
 }
 
+# Codec options forwarded to the libav decoder context. Slice threading
+# spreads decode work for a single frame across cores without the added
+# per-frame latency that frame threading would introduce. As above, these can
+# be overridden but it might result in undefined behavior.
+DEFAULT_LIB_OPTS = {
+    'threads': 'auto',       # let libav pick the thread count
+    'thread_type': 'slice'   # slice, not frame, to keep latency unchanged
+}
+
 # default queue size for the stream reader
 DEFAULT_FRAME_QUEUE_SIZE = 1
 
+# numpy entry points used on the per-frame path, bound on first use so merely
+# importing this module doesn't pull in numpy (see `_enqueueFrame`)
+_npFrombuffer = None
+_npUint8 = None
+
 # event to close all opened movie reader threads
 _evtCleanUpMovieEvent = threading.Event()
 _evtCleanUpMovieEvent.clear()
@@ -173,7 +186,7 @@ class StreamData:
 
     @metadata.setter
     def metadata(self, value):
-        if not isinstance(value, MovieMetadata) or value is not None:
+        if not isinstance(value, MovieMetadata) and value is not None:
             raise TypeError("Incorrect type for property `metadata`, expected "
                             "`MovieMetadata` or `None`.")
 
@@ -197,7 +210,7 @@ class StreamData:
 
     @streamStatus.setter
     def streamStatus(self, value):
-        if not isinstance(value, StreamStatus) or value is not None:
+        if not isinstance(value, StreamStatus) and value is not None:
             raise TypeError("Incorrect type for property `streamStatus`, "
                             "expected `StreamStatus` or `None`.")
 
@@ -214,6 +227,75 @@ class StreamData:
         return u''
 
 
+class _SpscRingBuffer:
+    """Fixed-capacity ring buffer for passing frames between two threads.
+
+    This is a single-producer, single-consumer buffer; only the decoder thread
+    may call `put` and only the application thread may call `get`. Under those
+    constraints the index updates are atomic on CPython (the GIL serializes
+    word-sized loads and stores), so `put` and `get` avoid the mutex and
+    condition variable `queue.Queue` acquires on every operation.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of slots in the buffer.
+
+    """
+    __slots__ = ['_slots', '_mask', '_head', '_tail']
+
+    def __init__(self, capacity):
+        # round the capacity up to a power of two so slot indices wrap with
+        # a bitmask instead of an integer modulo
+        nSlots = 1 << (max(1, int(capacity)) - 1).bit_length()
+        self._slots = [None] * nSlots
+        self._mask = nSlots - 1
+        self._head = 0  # next slot to write, only the producer updates this
+        self._tail = 0  # next slot to read, only the consumer updates this
+
+    def full(self):
+        """`True` if the buffer cannot accept another item (`bool`).
+        """
+        return self._head - self._tail > self._mask
+
+    def empty(self):
+        """`True` if there is nothing to read (`bool`).
+        """
+        return self._head == self._tail
+
+    def put(self, item):
+        """Add an item to the buffer.
+
+        If the buffer is full the most recently written slot is overwritten,
+        so the buffer always ends with the latest item. Only the producer
+        writes the newest slot, keeping this safe without a lock. Returns
+        `False` if an older item was displaced, `True` otherwise.
+        """
+        if self._head - self._tail > self._mask:
+            # full, replace the newest item rather than dropping this one
+            self._slots[(self._head - 1) & self._mask] = item
+            return False
+
+        self._slots[self._head & self._mask] = item
+        self._head += 1
+
+        return True
+
+    def get(self):
+        """Remove and return the oldest item in the buffer. Returns `None` if
+        the buffer is empty.
+        """
+        if self._head == self._tail:
+            return None
+
+        idx = self._tail & self._mask
+        item = self._slots[idx]
+        self._slots[idx] = None  # drop the buffer's reference to the item
+        self._tail += 1
+
+        return item
+
+
 class MovieStreamThreadFFPyPlayer(threading.Thread):
     """Class for reading movie streams asynchronously.
 
@@ -230,10 +312,15 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
     bufferFrames : int
         Number of frames to buffer. Sets the frame queue size for the thread.
         Use a queue size >1 for video recorded with a framerate above 60Hz.
+    pollDelayMin : float
+        Initial sleep in seconds between polls while waiting on the decoder.
+    pollDelayMax : float
+        Upper bound in seconds the poll delay may back off to.
 
     """
 
-    def __init__(self, player, bufferFrames=DEFAULT_FRAME_QUEUE_SIZE):
+    def __init__(self, player, bufferFrames=DEFAULT_FRAME_QUEUE_SIZE,
+                 pollDelayMin=0.0002, pollDelayMax=0.001):
         threading.Thread.__init__(self)
         # Make this thread daemonic since we don't yet have a way of tracking
         # them down. Since we're only reading resources, it's unlikely that
@@ -243,18 +330,35 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
         self.daemon = True
 
         self._player = player  # player interface to FFMPEG
-        self._frameQueue = queue.Queue(maxsize=bufferFrames)
+        self._frameQueue = _SpscRingBuffer(bufferFrames)
         self._cmdQueue = queue.Queue()  # queue for player commands
 
+        # bounds for the adaptive poll delay used when awaiting frames
+        self._pollDelayMin = pollDelayMin
+        self._pollDelayMax = pollDelayMax
+
         # some values the user might want
         self._status = NOT_STARTED
         self._streamTime = 0.0
         self._isIdling = False
         self._isFinished = False
 
-        # Locks for syncing the player and main application thread
-        self._warmUpLock = threading.Lock()
-        self._warmUpLock.acquire(blocking=False)
+        # stream metadata and the frame interval derived from it, obtained
+        # once during warmup since both are static for the life of the stream
+        self._metadata = None
+        self._frameInterval = None
+
+        # Event set by the thread once the first frame and metadata are
+        # available; used to sync the player and main application thread
+        self._warmUpEvent = threading.Event()
+
+        # Event set whenever a command is posted, so the thread can block
+        # while paused or idling instead of polling on a timer.
+        self._wakeUpEvent = threading.Event()
+
+        # Event set each time a new frame is published, letting consumers
+        # block until the next frame instead of spin-polling for it.
+        self._newFrameEvent = threading.Event()
 
     def run(self):
         """Main sub-routine for this thread.
@@ -278,6 +382,7 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
         frameIndex = -1              # frame index, 0 == first frame
         loopCount = 0                # number of movie loops so far
         mustShutdown = False         # player thread should shut down
+        nextDeadline = time.perf_counter()   # deadline for the next poll
 
         # Subroutines for various player functions -----------------------------
 
@@ -380,17 +485,24 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
         self._player.set_pause(False)
 
         # consume frames until we get a valid one, need its metadata
-        while frameData is None or val == 'not ready':
+        pollDelay = self._pollDelayMin
+        while True:
             frameData, val = self._player.get_frame(show=True)
             # end of the file? ... at this point? something went wrong ...
             if val == 'eof':
                 break
-            time.sleep(frameInterval)  # sleep a bit to avoid mashing the CPU
-
-        # Obtain metadata from the frame now that we have a flowing stream. This
-        # data is needed by the main thread to process to configure additional
-        # resources needed to present the video.
-        metadata = self._player.get_metadata()
+            if frameData is not None and val != 'not ready':
+                break  # got a valid frame, move on without sleeping again
+            # back off exponentially so we wake soon after the decoder has a
+            # frame ready without mashing the CPU while it doesn't
+            time.sleep(pollDelay)
+            pollDelay = min(pollDelay * 2, self._pollDelayMax)
+
+        # Obtain metadata from the frame now that we have a flowing stream.
+        # This data is needed by the main thread to configure additional
+        # resources needed to present the video. It is fetched (and cached)
+        # only once here; metadata does not change over the life of a stream.
+        metadata = self._metadata = self._player.get_metadata()
 
         # Compute the frame interval that will be used, this is dynamically set
         # to reduce the amount of CPU load when obtaining new frames. Aliasing
@@ -407,6 +519,8 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
                 "Cannot play movie. Failed to acquire metadata from video "
                 "stream!")
 
+        self._frameInterval = frameInterval  # cache for the main thread
+
         # Get the movie duration, needed to determine when we get to the end of
         # movie. We need to reset some params when there. This is in seconds.
         duration = metadata['duration']
@@ -416,44 +530,41 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
         # thread with status information.
         colorData, pts = frameData
 
-        # Build up the object which we'll pass to the application thread. Stream
-        # status information hold timestamp and playback information.
-        streamStatus = StreamStatus(
-            status=statusFlag,    # current status flag, should be `NOT_STARTED`
-            streamTime=pts)       # frame timestamp
-
-        # Put the frame in the frame queue so the main thread can read access it
-        # safely. The main thread should hold onto any frame it gets when the
-        # queue is empty.
-        if self._frameQueue.full():
-            raise RuntimeError(
-                "Movie decoder frame queue is full and it really shouldn't be "
-                "at this point.")
-
-        # Object to pass video frame data back to the application thread for
-        # presentation or processing.
-        lastFrame = StreamData(
-            metadata,
-            colorData,
-            streamStatus,
-            u'ffpyplayer')
-
-        # Pass the object to the main thread using the frame queue.
-        self._frameQueue.put(lastFrame)  # put frame data in here
+        # Pre-allocate the status and frame data objects passed back to the
+        # application thread; these are recycled for every frame published
+        # rather than allocated anew. Two of each are kept and written
+        # alternately, giving the consumer a full frame period to read a cell
+        # before it gets overwritten.
+        statusCells = (
+            StreamStatus(
+                status=statusFlag,  # current status flag, `NOT_STARTED` here
+                streamTime=pts),    # frame timestamp
+            StreamStatus())
+        dataCells = (
+            StreamData(metadata, colorData, statusCells[0], u'ffpyplayer'),
+            StreamData(metadata, None, statusCells[1], u'ffpyplayer'))
+        cellIdx = 0
+
+        # Pass the first frame to the main thread using the frame buffer.
+        self._frameQueue.put(dataCells[cellIdx])  # put frame data in here
+        self._newFrameEvent.set()
 
         # Rewind back to the beginning of the file, we should have the first
         # frame and metadata from the file by now.
         self._player.set_pause(True)  # start paused
         self._player.set_mute(False)
+        # Pause state mirrored locally so play/pause commands only call into
+        # the player on actual transitions.
+        currentlyPaused = True
         # frameData, val = seekTo(self._player, 0.0)
 
         # set the volume again because irt doesn't seem to remember it
         self._player.set_volume(self._player.get_volume())
 
-        # Release the lock to unblock the parent thread once we have the first
-        # frame and valid metadata from the stream. After this returns the
-        # main thread should call `getRecentFrame` to get the frame data.
-        self._warmUpLock.release()
+        # Signal the parent thread once we have the first frame and valid
+        # metadata from the stream. After this the main thread should call
+        # `getRecentFrame` to get the frame data.
+        self._warmUpEvent.set()
 
         # ----------------------------------------------------------------------
         # Playback
@@ -469,41 +580,64 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
             # if no frame, just pause the thread and restart the loop
             if val == 'eof':  # end of stream/file
                 self._isFinished = self._isIdling = True
-                time.sleep(frameInterval)
+                # block until a command arrives rather than polling; the
+                # timeout just bounds shutdown latency
+                self._wakeUpEvent.wait(timeout=0.05)
             elif frameData is None or val == 'paused':  # paused or not ready
                 self._isIdling = True
                 self._isFinished = False
-                time.sleep(frameInterval)
+                self._wakeUpEvent.wait(timeout=0.05)
             else:  # playing
                 self._isIdling = self._isFinished = False
+
+                # A zero wait time from the decoder means the next frame is
+                # already due, so skip ahead to the newest one rather than
+                # spending a publish cycle on a frame about to be superseded.
+                # Interim frames are dropped before being wrapped for the
+                # application thread.
+                while isinstance(val, float) and val <= 0.0:
+                    nextFrameData, nextVal = self._player.get_frame()
+                    if nextFrameData is None or nextVal in ('paused', 'eof'):
+                        break
+                    frameData, val = nextFrameData, nextVal
+
                 colorData, pts = frameData  # got a valid frame
 
-                # updated last valid frame data
-                lastFrame = StreamData(
-                    metadata,
-                    colorData,
-                    StreamStatus(
-                        status=statusFlag,  # might remove
-                        streamTime=pts,
-                        frameIndex=calcFrameIndex(pts, frameInterval),
-                        loopCount=loopCount),
-                    u'ffpyplayer')
+                # Update the last valid frame data by recycling the inactive
+                # pair of cells; fields are written in place since metadata
+                # and the library name never change after warmup.
+                cellIdx ^= 1
+                streamStatus = statusCells[cellIdx]
+                streamStatus._status = statusFlag  # might remove
+                streamStatus._streamTime = pts
+                streamStatus._frameIndex = calcFrameIndex(pts, frameInterval)
+                streamStatus._loopCount = loopCount
+                lastFrame = dataCells[cellIdx]
+                lastFrame._frameImage = colorData
 
                 # is the next frame the last? increment the number of loops then
                 if pts + frameInterval * 1.5 >= duration:
                     loopCount += 1  # inc number of loops
 
-                if isinstance(val, float):
-                    time.sleep(val)  # time to sleep
-                else:
-                    time.sleep(frameInterval)
-
-                # If the queue is full, just discard the frame and get the
-                # next one to allow us to catch up.
-                try:
-                    self._frameQueue.put_nowait(lastFrame)
-                except queue.Full:
-                    pass  # do nothing
+                # Pace the next poll against a monotonic deadline so time
+                # spent in get_frame and publishing doesn't stretch the
+                # effective poll period. `val` is the wait the decoder asked
+                # for when given, otherwise one frame interval.
+                waitTime = val if isinstance(val, float) else frameInterval
+                now = time.perf_counter()
+                if nextDeadline < now - frameInterval:
+                    # fell well behind, rebase instead of spiralling to catch
+                    # up with a burst of undelayed polls
+                    nextDeadline = now
+                nextDeadline += waitTime
+                sleepFor = nextDeadline - time.perf_counter()
+                if sleepFor > 0.0:
+                    time.sleep(sleepFor)
+
+                # If the buffer is full, this frame replaces the newest unread
+                # one so the most recent frame is always available.
+                self._frameQueue.put(lastFrame)
+                self._newFrameEvent.set()
 
             # ------------------------------------------------------------------
             # Process playback controls
@@ -531,6 +665,7 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
             #
             needsWait = False
             if not self._cmdQueue.empty():
+                self._wakeUpEvent.clear()  # posters will set it again
                 cmdOpCode, cmdVal = self._cmdQueue.get_nowait()
 
                 # process the command
@@ -541,11 +676,15 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
                     self._player.set_mute(bool(cmdVal))
                     needsWait = True
                 elif cmdOpCode == 'play':
-                    self._player.set_mute(False)
-                    self._player.set_pause(False)
+                    if currentlyPaused:  # FFI calls only on transitions
+                        self._player.set_mute(False)
+                        self._player.set_pause(False)
+                        currentlyPaused = False
                 elif cmdOpCode == 'pause':
-                    self._player.set_mute(True)
-                    self._player.set_pause(True)
+                    if not currentlyPaused:
+                        self._player.set_mute(True)
+                        self._player.set_pause(True)
+                        currentlyPaused = True
                 elif cmdOpCode == 'seek':
                     seekToPts, seekRel = cmdVal
                     self._player.seek(
@@ -560,6 +699,7 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
                         relative=False,
                         accurate=True)
                     self._player.set_pause(True)
+                    currentlyPaused = True
                     loopCount = 0  # reset loop count
                     time.sleep(0.1)
                 elif cmdOpCode == 'shutdown':  # shutdown the player
@@ -593,55 +733,77 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
         """
         return self._isIdling
 
+    @property
+    def metadata(self):
+        """Metadata dict obtained from the stream during warmup (`dict`).
+        `None` until the first frame has been acquired.
+        """
+        return self._metadata
+
+    @property
+    def frameInterval(self):
+        """Nominal duration of a single frame in seconds (`float`), derived
+        once from the stream's frame rate. `None` until warmup completes.
+        """
+        return self._frameInterval
+
     @property
     def isReady(self):
         """`True` if the stream reader is ready (`bool`).
         """
-        return not self._warmUpLock.locked()
+        return self._warmUpEvent.is_set()
 
-    def begin(self):
+    def begin(self, timeout=5.0):
         """Call this to start the thread and begin reading frames. This will
         block until we get a valid frame.
+
+        Parameters
+        ----------
+        timeout : float or None
+            Longest time in seconds to wait for the stream to warm up before
+            giving up. Use `None` to wait indefinitely.
+
         """
         self.start()  # start the thread, will begin decoding frames
-        # hold until the lock is released when the thread gets a valid frame
-        # this will prevent the main loop for executing until we're ready
-        self._warmUpLock.acquire(blocking=True)
+        # hold until the thread signals it has a valid frame and metadata,
+        # this will prevent the main loop from executing until we're ready
+        if not self._warmUpEvent.wait(timeout):
+            raise RuntimeError(
+                "Movie stream failed to provide a frame within {} seconds of "
+                "starting.".format(timeout))
 
-    def play(self):
-        """Start playing the video from the stream.
+    def _postCommand(self, cmd):
+        """Post a command to the player thread, wake the thread if it's
+        idling, then block until the command has been processed.
         """
-        cmd = ('play', None)
         self._cmdQueue.put(cmd)
+        self._wakeUpEvent.set()
         self._cmdQueue.join()
 
+    def play(self):
+        """Start playing the video from the stream.
+        """
+        self._postCommand(('play', None))
+
     def pause(self):
         """Stop recording frames to the output file.
         """
-        cmd = ('pause', None)
-        self._cmdQueue.put(cmd)
-        self._cmdQueue.join()
+        self._postCommand(('pause', None))
 
     def seek(self, pts, relative=False):
         """Seek to a position in the video.
         """
-        cmd = ('seek', (pts, relative))
-        self._cmdQueue.put(cmd)
-        self._cmdQueue.join()
+        self._postCommand(('seek', (pts, relative)))
 
     def stop(self):
         """Stop playback, reset the movie to the beginning.
         """
-        cmd = ('stop', None)
-        self._cmdQueue.put(cmd)
-        self._cmdQueue.join()
+        self._postCommand(('stop', None))
 
     def shutdown(self):
         """Shutdown the movie reader thread.
         """
-        cmd = ('shutdown', None)
-        self._cmdQueue.put(cmd)
-        self._cmdQueue.join()
+        self._postCommand(('shutdown', None))
 
     def isDone(self):
         """Check if the video is done playing.
@@ -670,9 +832,7 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
             New volume level, ranging between 0 and 1.
 
         """
-        cmd = ('volume', volume)
-        self._cmdQueue.put(cmd)
-        self._cmdQueue.join()
+        self._postCommand(('volume', volume))
 
     def setMute(self, mute):
         """Set the volume for the video.
@@ -683,13 +843,20 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
             Mute state. If `True`, audio will be muted.
 
         """
-        cmd = ('mute', mute)
-        self._cmdQueue.put(cmd)
-        self._cmdQueue.join()
+        self._postCommand(('mute', mute))
 
-    def getRecentFrame(self):
+    def getRecentFrame(self, block=False, timeout=None):
         """Get the most recent frame data from the feed (`tuple`).
 
+        Parameters
+        ----------
+        block : bool
+            Wait until a new frame has been published rather than returning
+            `None` right away when there isn't one.
+        timeout : float or None
+            Longest time in seconds to wait for a frame when `block` is
+            `True`. Use `None` to wait indefinitely.
+
         Returns
         -------
         tuple or None
@@ -700,11 +867,30 @@ class MovieStreamThreadFFPyPlayer(threading.Thread):
             frame data.
 
         """
-        if self._frameQueue.empty():
+        if block:
+            if not self._newFrameEvent.wait(timeout):
+                return None  # timed out without a new frame arriving
+        elif not self._newFrameEvent.is_set():
+            # Cheap flag test before touching the ring; the event is set on
+            # every publish and only cleared below, so unset means nothing new
+            # since the last drain. This is the common case when the display
+            # refreshes faster than the source frame rate.
             return None
 
-        # hold only last frame and return that instead of None?
-        return self._frameQueue.get()
+        # clear before draining; if the thread publishes right after this the
+        # event just gets set again and the next call sees it
+        self._newFrameEvent.clear()
+
+        # Drain the buffer so we always hand back the most recent frame;
+        # anything older is already stale by the time the render thread asks.
+        frame = None
+        while True:
+            item = self._frameQueue.get()
+            if item is None:
+                break
+            frame = item
+
+        return frame  # `None` if no new frame since the last call
 
 
 class FFPyPlayer(BaseMoviePlayer):
@@ -735,8 +921,28 @@ class FFPyPlayer(BaseMoviePlayer):
         self._loopCount = 0
         self._metadata = None  # metadata from the stream
 
-        self._lastPlayerOpts = DEFAULT_FF_OPTS.copy()
+        # timing values cached at load so frame index <-> time conversions
+        # are a bare multiply rather than a metadata fetch
+        self._frameInterval = None
+        self._invFrameInterval = None
+        self._duration = None
+
+        # per-stream values which are fixed once decoding starts; the metadata
+        # object and frame size are memoized so per-frame calls don't rebuild
+        # them (`getMetadata` is hit every refresh by the stimulus too)
+        self._metadataCache = None
+        self._frameSize = None
 
+        self._lastPlayerOpts = DEFAULT_FF_OPTS.copy()
+        self._lastPlayerLibOpts = DEFAULT_LIB_OPTS.copy()
+
+        # Ask the decoder for packed BGRA output. The YUV->RGB conversion has
+        # to happen somewhere; doing it in the decoder's swscale pass means
+        # `MovieStim` can stream the frame to its pixel buffer unchanged and
+        # upload it as `GL_BGRA`, which drivers accept without a swizzle. A
+        # planar YUV handoff with the conversion in a fragment shader would
+        # shave off the swscale pass but needs a multi-texture sampler path in
+        # the stimulus; revisit if CPU-side conversion shows up in profiles.
         self._lastPlayerOpts['out_fmt'] = 'bgra'
 
         # options from the parent
@@ -759,9 +965,14 @@ class FFPyPlayer(BaseMoviePlayer):
         # clear queued data from previous streams
         self._lastFrame = None
         self._frameIndex = -1
+        self._metadataCache = None
+        self._frameSize = None
 
         # open the media player
-        handle = MediaPlayer(self._filename, ff_opts=self._lastPlayerOpts)
+        handle = MediaPlayer(
+            self._filename,
+            ff_opts=self._lastPlayerOpts,
+            lib_opts=self._lastPlayerLibOpts)
         handle.set_pause(True)
 
         # Pull the first frame to get metadata. NB - `_enqueueFrame` should be
@@ -775,6 +986,11 @@ class FFPyPlayer(BaseMoviePlayer):
         self._tStream = MovieStreamThreadFFPyPlayer(handle)
         self._tStream.begin()
 
+        # cache timing info the stream thread derived during warmup
+        self._frameInterval = self._tStream.frameInterval
+        self._invFrameInterval = 1.0 / self._frameInterval
+        self._duration = self._tStream.metadata['duration']
+
         # make sure we have metadata
         self.update()
 
@@ -794,13 +1010,6 @@ class FFPyPlayer(BaseMoviePlayer):
         # Check if the player is already started. Close it and load a new
         # instance if so.
         if self._tStream is not None:  # player already started
-            # make sure it's the correct type
-            # if not isinstance(self._handle, MediaPlayer):
-            #     raise TypeError(
-            #         'Incorrect type for `FFMovieStim._player`, expected '
-            #         '`ffpyplayer.player.MediaPlayer`. Got type `{}` '
-            #         'instead.'.format(type(self._handle).__name__))
-
             # close the player and reset
             self.unload()
 
@@ -823,15 +1032,13 @@ class FFPyPlayer(BaseMoviePlayer):
 
         self._filename = u""
         self._frameIndex = -1
+        self._frameInterval = None
+        self._invFrameInterval = None
+        self._duration = None
+        self._metadataCache = None
+        self._frameSize = None
         self._handle = None  # reset
 
-    # @property
-    # def handle(self):
-    #     """Handle to the `MediaPlayer` object exposed by FFPyPlayer. If `None`,
-    #     no media player object has yet been initialized.
-    #     """
-    #     return self._handle
-
     @property
     def isLoaded(self):
         return self._tStream is not None
@@ -856,21 +1063,25 @@ class FFPyPlayer(BaseMoviePlayer):
         """
         self._assertMediaPlayer()
 
-        metadata = self._metadata
-
-        # write metadata to the fields of a `MovieMetadata` object
-        toReturn = MovieMetadata(
-            mediaPath=self._filename,
-            title=metadata['title'],
-            duration=metadata['duration'],
-            frameRate=metadata['frame_rate'],
-            size=metadata['src_vid_size'],
-            pixelFormat=metadata['src_pix_fmt'],
-            movieLib=self._movieLib,
-            userData=None
-        )
-
-        return toReturn
+        # the stream metadata is fixed for the life of the stream, so build
+        # the `MovieMetadata` object once and hand back the same instance on
+        # subsequent calls (this runs once per refresh on the display path)
+        if self._metadataCache is None:
+            metadata = self._metadata
+
+            # write metadata to the fields of a `MovieMetadata` object
+            self._metadataCache = MovieMetadata(
+                mediaPath=self._filename,
+                title=metadata['title'],
+                duration=metadata['duration'],
+                frameRate=metadata['frame_rate'],
+                size=metadata['src_vid_size'],
+                pixelFormat=metadata['src_pix_fmt'],
+                movieLib=self._movieLib,
+                userData=None
+            )
+
+        return self._metadataCache
 
     def _assertMediaPlayer(self):
         """Ensure the media player instance is available. Raises a
@@ -1043,6 +1254,13 @@ class FFPyPlayer(BaseMoviePlayer):
         log : bool
             Log this event.
 
+        Notes
+        -----
+        * This rewinds the running decoder with a seek to the start rather
+          than tearing it down and reloading the file, so no codec init or
+          first-frame warmup is paid. Use `restart()` if you need a fresh
+          media player instance.
+
         """
         self._assertMediaPlayer()
         self.pause(log=log)
@@ -1076,16 +1294,6 @@ class FFPyPlayer(BaseMoviePlayer):
     # Audio stream control methods
     #
 
-    # @property
-    # def muted(self):
-    #     """`True` if the stream audio is muted (`bool`).
-    #     """
-    #     return self._handle.get_mute()  # thread-safe?
-    #
-    # @muted.setter
-    # def muted(self, value):
-    #     self._tStream.setMute(value)
-
     def volumeUp(self, amount):
         """Increase the volume by a fixed amount.
 
@@ -1247,7 +1455,7 @@ class FFPyPlayer(BaseMoviePlayer):
         """
         self._assertMediaPlayer()
 
-        return frameIdx * self._metadata.frameInterval
+        return frameIdx * self._frameInterval
 
     def frameIndexFromMovieTime(self, movieTime):
         """Get the frame index of a given movie time.
@@ -1265,7 +1473,7 @@ class FFPyPlayer(BaseMoviePlayer):
         """
         self._assertMediaPlayer()
 
-        return math.floor(movieTime / self._metadata.frameInterval)
+        return math.floor(movieTime * self._invFrameInterval)
 
     @property
     def isSeekable(self):
@@ -1280,7 +1488,7 @@ class FFPyPlayer(BaseMoviePlayer):
         is derived from the framerate information in the metadata. If not movie
         is loaded, the returned value will be invalid.
         """
-        return self.metadata.frameInterval
+        return self._frameInterval
 
     @property
     def frameIndex(self):
@@ -1298,32 +1506,62 @@ class FFPyPlayer(BaseMoviePlayer):
         """Provides a value between 0.0 and 100.0, indicating the amount of the
         movie that has been already played (`float`).
         """
-        duration = self.metadata.duration
-
-        return (self.pts / duration) * 100.0
+        return (self.pts / self._duration) * 100.0
 
     # --------------------------------------------------------------------------
     # Methods for getting video frames from the encoder
     #
 
-    def _enqueueFrame(self):
+    def _enqueueFrame(self, blockUntilFrame=False, timeout=None):
         """Grab the latest frame from the stream.
 
+        Parameters
+        ----------
+        blockUntilFrame : bool
+            Sleep until the stream thread publishes a new frame instead of
+            returning `False` right away when there isn't one. The wait is
+            event-driven (no polling), so the calling thread wakes as soon as
+            the frame lands.
+        timeout : float or None
+            Longest time in seconds to wait for a frame when `blockUntilFrame`
+            is `True`. Use `None` to wait indefinitely.
+
         Returns
         -------
         bool
             `True` if a frame has been enqueued. Returns `False` if the camera
             is not ready or if the stream was closed.
 
+        Notes
+        -----
+        * This path is memory-bound, not compute-bound: at HD and above a
+          frame is several megabytes, so the cost is dominated by bytes moved
+          (decoder color conversion plus any copies), not arithmetic. That is
+          why the frame array is a zero-copy view over the decoder's plane
+          rather than a copied buffer; a view costs the same regardless of
+          frame size, so no small-frame/large-frame split is needed.
+
         """
         self._assertMediaPlayer()
 
         # If the queue is empty, the decoder thread has not yielded a new frame
-        # since the last call.
-        enqueuedFrame = self._tStream.getRecentFrame()
+        # since the last call. Bail out before touching anything else; the
+        # frame already on screen (`_lastFrame`) stays valid and none of the
+        # unpack/conversion work below runs. On a 60 Hz display showing 24 fps
+        # video this is the common case.
+        enqueuedFrame = self._tStream.getRecentFrame(
+            block=blockUntilFrame, timeout=timeout)
         if enqueuedFrame is None:
             return False
 
+        # bind the numpy entry points once; after this, converting a frame
+        # costs a single call with no module/attribute lookups
+        global _npFrombuffer, _npUint8
+        if _npFrombuffer is None:
+            import numpy as np  # deferred so importing this module stays cheap
+            _npFrombuffer = np.frombuffer
+            _npUint8 = np.uint8
+
         # Unpack the data we got back ...
         # Note - Bit messy here, we should just hold onto the `enqueuedFrame`
         # instance and reference its fields from properties. Keeping like this
@@ -1337,23 +1575,46 @@ class FFPyPlayer(BaseMoviePlayer):
         # status information
         self._streamTime = streamStatus.streamTime  # stream time for the camera
 
-        # if we have a new frame, update the frame information
+        # the frame size is constant for the stream, query it only once
+        if self._frameSize is None:
+            self._frameSize = frameImage.get_size()
+
+        # If we have a new frame, update the frame information. This is a
+        # zero-copy path: `to_memoryview` exposes the decoder's pixel plane
+        # directly and `frombuffer` wraps it without copying. The `keepAlive`
+        # reference on the MovieFrame below pins the Image so the array view
+        # stays valid for the life of the frame. Stride safety: with the
+        # default `keep_align=False`, ffpyplayer hands back tightly packed
+        # rows, copying internally only when the plane carries SIMD alignment
+        # padding (linesize > width * bpp) -- so the flat view never includes
+        # padding bytes and the GL upload can assume packed rows.
         videoBuffer = frameImage.to_memoryview()[0].memview
-        videoFrameArray = np.frombuffer(videoBuffer, dtype=np.uint8)
-
-        # provide the last frame
-        self._lastFrame = MovieFrame(
-            frameIndex=self._frameIndex,
-            absTime=self._streamTime,
-            displayTime=self.metadata.frameInterval,
-            size=frameImage.get_size(),
-            colorData=videoFrameArray,
-            audioChannels=0,  # not populated yet ...
-            audioSamples=None,
-            metadata=self.metadata,
-            movieLib=u'ffpyplayer',
-            userData=None,
-            keepAlive=frameImage)
+        videoFrameArray = _npFrombuffer(videoBuffer, dtype=_npUint8)
+
+        # Provide the last frame. The wrapper object is built once per stream
+        # and recycled afterwards; only the fields which actually change from
+        # frame to frame are written (through the slots directly, skipping the
+        # property setters), so steady-state playback allocates no `MovieFrame`
+        # per frame. Never recycle the shared null-frame sentinel.
+        lastFrame = self._lastFrame
+        if lastFrame is None or lastFrame is NULL_MOVIE_FRAME_INFO:
+            self._lastFrame = MovieFrame(
+                frameIndex=self._frameIndex,
+                absTime=self._streamTime,
+                displayTime=self._frameInterval,
+                size=self._frameSize,
+                colorData=videoFrameArray,
+                audioChannels=0,  # not populated yet ...
+                audioSamples=None,
+                metadata=self.getMetadata(),
+                movieLib=u'ffpyplayer',
+                userData=None,
+                keepAlive=frameImage)
+        else:
+            lastFrame._frameIndex = self._frameIndex
+            lastFrame._absTime = self._streamTime
+            lastFrame._colorData = videoFrameArray
+            lastFrame._keepAlive = frameImage
 
         return True
 